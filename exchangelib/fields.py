@@ -859,6 +859,13 @@ class IdField(CharField):
         self.is_searchable = False
         self.is_attribute = True
 
+    def clean(self, value, version=None):
+        # Fast path for the common case of a valid ID. IDs are validated for every ID element we create, so skip the
+        # generic checks in the parent classes. Any invalid value falls through to those checks for proper errors.
+        if isinstance(value, str) and len(value) <= self.max_length and (not version or self.supports_version(version)):
+            return value
+        return super().clean(value, version=version)
+
 
 class CharListField(TextListField):
     """Like TextListField, but for string values with a limited length."""
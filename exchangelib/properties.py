@@ -1,4 +1,3 @@
-import abc
 import binascii
 import codecs
 import datetime
@@ -66,6 +65,22 @@ from .version import EXCHANGE_2013, Build, Version
 
 log = logging.getLogger(__name__)
 
+# Tag names used by custom from_xml() implementations. Build them once instead of for every parsed element.
+_T_DURATION = f"{{{TNS}}}Duration"
+_T_EMAIL_ADDRESS = f"{{{TNS}}}EmailAddress"
+_T_ID = f"{{{TNS}}}Id"
+_T_MAILBOX_TYPE = f"{{{TNS}}}MailboxType"
+_T_NAME = f"{{{TNS}}}Name"
+_T_WORKING_HOURS = f"{{{TNS}}}WorkingHours"
+_A_ERROR_CODE = f"{{{ANS}}}ErrorCode"
+_A_ERROR_MESSAGE = f"{{{ANS}}}ErrorMessage"
+_A_NAME = f"{{{ANS}}}Name"
+_A_REDIRECT_TARGET = f"{{{ANS}}}RedirectTarget"
+_A_SETTING_NAME = f"{{{ANS}}}SettingName"
+_A_USER_SETTINGS = f"{{{ANS}}}UserSettings"
+_A_USER_SETTING_ERRORS = f"{{{ANS}}}UserSettingErrors"
+_A_VALUE = f"{{{ANS}}}Value"
+
 
 class Fields(list):
     """A collection type for the FIELDS class attribute. Works like a list but supports fast lookup by name."""
@@ -200,7 +215,7 @@ def _mangle(field_name):
     return f"__{field_name}"
 
 
-class EWSMeta(type, metaclass=abc.ABCMeta):
+class EWSMeta(type):
     def __new__(mcs, name, bases, kwargs):
         # Collect fields defined directly on the class
         local_fields = Fields()
@@ -233,8 +248,23 @@ class EWSMeta(type, metaclass=abc.ABCMeta):
             kwargs["FIELDS"] = fields
         klass = super().__new__(mcs, name, bases, kwargs)
         klass._slots_keys = mcs._get_slots_keys(klass)
+        mcs._set_tags(klass)
         return klass
 
+    @staticmethod
+    def _set_tags(klass):
+        # Cache the XML tag names. They are requested for every element we create or parse. Classes may set
+        # '_response_namespace' and '_response_element_name' if the element uses a different tag in responses than in
+        # requests. These are inherited, so subclasses get the same treatment.
+        element_name, namespace = klass.ELEMENT_NAME, klass.NAMESPACE
+        if not element_name:
+            klass._request_tag = klass._response_tag = None
+            return
+        klass._request_tag = {TNS: f"t:{element_name}", MNS: f"m:{element_name}"}.get(namespace)
+        response_namespace = klass._response_namespace or namespace
+        response_element_name = klass._response_element_name or element_name
+        klass._response_tag = f"{{{response_namespace}}}{response_element_name}" if response_namespace else None
+
     @staticmethod
     def _get_slots_keys(klass):
         seen = set()
@@ -266,6 +296,8 @@ class EWSElement(metaclass=EWSMeta):
     FIELDS = Fields()  # A list of attributes supported by this item class, ordered the same way as in EWS documentation
     NAMESPACE = TNS  # The XML tag namespace. Either TNS or MNS
 
+    _response_namespace = None  # The XML tag namespace in responses, if different from NAMESPACE
+    _response_element_name = None  # The name of the XML tag in responses, if different from ELEMENT_NAME
     _fields_lock = Lock()
 
     def __init__(self, **kwargs):
@@ -330,7 +362,7 @@ class EWSElement(metaclass=EWSMeta):
             value = getattr(self, f.name)
             if value is None or (f.is_list and not value):
                 continue
-            attrs[f.field_uri] = value_to_xml_text(getattr(self, f.name))
+            attrs[f.field_uri] = value_to_xml_text(value)
 
         # Create element with attributes
         elem = create_element(self.request_tag(), attrs=attrs)
@@ -347,20 +379,21 @@ class EWSElement(metaclass=EWSMeta):
 
     @classmethod
     def request_tag(cls):
-        if not cls.ELEMENT_NAME:
-            raise ValueError(f"Class {cls} is missing the ELEMENT_NAME attribute")
-        return {
-            TNS: f"t:{cls.ELEMENT_NAME}",
-            MNS: f"m:{cls.ELEMENT_NAME}",
-        }[cls.NAMESPACE]
+        tag = cls._request_tag
+        if tag is None:
+            if not cls.ELEMENT_NAME:
+                raise ValueError(f"Class {cls} is missing the ELEMENT_NAME attribute")
+            raise ValueError(f"Class {cls} has an unsupported NAMESPACE attribute")
+        return tag
 
     @classmethod
     def response_tag(cls):
-        if not cls.NAMESPACE:
-            raise ValueError(f"Class {cls} is missing the NAMESPACE attribute")
-        if not cls.ELEMENT_NAME:
+        tag = cls._response_tag
+        if tag is None:
+            if not cls.NAMESPACE:
+                raise ValueError(f"Class {cls} is missing the NAMESPACE attribute")
             raise ValueError(f"Class {cls} is missing the ELEMENT_NAME attribute")
-        return f"{{{cls.NAMESPACE}}}{cls.ELEMENT_NAME}"
+        return tag
 
     @classmethod
     def attribute_fields(cls):
@@ -375,7 +408,8 @@ class EWSElement(metaclass=EWSMeta):
     @classmethod
     def get_field_by_fieldname(cls, fieldname):
         try:
-            return cls.FIELDS[fieldname]
+            # Look up directly in the name index. Fields keeps it up to date on add_field() and remove_field().
+            return cls.FIELDS._dict[fieldname]
         except KeyError:
             raise InvalidField(f"{fieldname!r} is not a valid field name on {cls.__name__}")
 
@@ -427,6 +461,9 @@ class EWSElement(metaclass=EWSMeta):
             delattr(cls, _mangle(field.name))
 
     def __eq__(self, other):
+        if self is other:
+            # Skip hashing all field values
+            return True
         return hash(self) == hash(other)
 
     def __hash__(self):
@@ -540,11 +577,8 @@ class PersonaId(ItemId):
 
     ELEMENT_NAME = "PersonaId"
     NAMESPACE = MNS
-
-    @classmethod
-    def response_tag(cls):
-        # This element is in MNS in the request and TNS in the response...
-        return f"{{{TNS}}}{cls.ELEMENT_NAME}"
+    # This element is in MNS in the request and TNS in the response...
+    _response_namespace = TNS
 
 
 class SourceId(ItemId):
@@ -618,16 +652,18 @@ class Mailbox(EWSElement):
     ELEMENT_NAME = "Mailbox"
     MAILBOX = "Mailbox"
     ONE_OFF = "OneOff"
-    MAILBOX_TYPE_CHOICES = {
-        Choice(MAILBOX),
-        Choice("PublicDL"),
-        Choice("PrivateDL"),
-        Choice("Contact"),
-        Choice("PublicFolder"),
-        Choice("Unknown"),
-        Choice(ONE_OFF),
-        Choice("GroupMailbox", supported_from=EXCHANGE_2013),
-    }
+    MAILBOX_TYPE_CHOICES = frozenset(
+        {
+            Choice(MAILBOX),
+            Choice("PublicDL"),
+            Choice("PrivateDL"),
+            Choice("Contact"),
+            Choice("PublicFolder"),
+            Choice("Unknown"),
+            Choice(ONE_OFF),
+            Choice("GroupMailbox", supported_from=EXCHANGE_2013),
+        }
+    )
 
     name = TextField(field_uri="Name")
     email_address = EmailAddressField(field_uri="EmailAddress")
@@ -800,7 +836,7 @@ class Attendee(EWSElement):
     """MSDN: https://docs.microsoft.com/en-us/exchange/client-developer/web-service-reference/attendee"""
 
     ELEMENT_NAME = "Attendee"
-    RESPONSE_TYPES = {"Unknown", "Organizer", "Tentative", "Accept", "Decline", "NoResponseReceived"}
+    RESPONSE_TYPES = frozenset({"Unknown", "Organizer", "Tentative", "Accept", "Decline", "NoResponseReceived"})
 
     mailbox = MailboxField(is_required=True)
     response_type = ChoiceField(
@@ -998,7 +1034,7 @@ class FreeBusyView(EWSElement):
     @classmethod
     def from_xml(cls, elem, account):
         kwargs = {}
-        working_hours_elem = elem.find(f"{{{TNS}}}WorkingHours")
+        working_hours_elem = elem.find(_T_WORKING_HOURS)
         for f in cls.FIELDS:
             if f.name in ("working_hours", "working_hours_timezone"):
                 if working_hours_elem is None:
@@ -1015,12 +1051,10 @@ class RoomList(Mailbox):
 
     ELEMENT_NAME = "RoomList"
     NAMESPACE = MNS
-
-    @classmethod
-    def response_tag(cls):
-        # In a GetRoomLists response, room lists are delivered as Address elements. See
-        # https://docs.microsoft.com/en-us/exchange/client-developer/web-service-reference/address-emailaddresstype
-        return f"{{{TNS}}}Address"
+    # In a GetRoomLists response, room lists are delivered as Address elements. See
+    # https://docs.microsoft.com/en-us/exchange/client-developer/web-service-reference/address-emailaddresstype
+    _response_namespace = TNS
+    _response_element_name = "Address"
 
 
 class Room(Mailbox):
@@ -1030,12 +1064,12 @@ class Room(Mailbox):
 
     @classmethod
     def from_xml(cls, elem, account):
-        id_elem = elem.find(f"{{{TNS}}}Id")
+        id_elem = elem.find(_T_ID)
         item_id_elem = id_elem.find(ItemId.response_tag())
         kwargs = dict(
-            name=get_xml_attr(id_elem, f"{{{TNS}}}Name"),
-            email_address=get_xml_attr(id_elem, f"{{{TNS}}}EmailAddress"),
-            mailbox_type=get_xml_attr(id_elem, f"{{{TNS}}}MailboxType"),
+            name=get_xml_attr(id_elem, _T_NAME),
+            email_address=get_xml_attr(id_elem, _T_EMAIL_ADDRESS),
+            mailbox_type=get_xml_attr(id_elem, _T_MAILBOX_TYPE),
             item_id=ItemId.from_xml(elem=item_id_elem, account=account) if item_id_elem else None,
         )
         cls._clear(elem)
@@ -1260,7 +1294,7 @@ class OutOfOffice(EWSElement):
     @classmethod
     def duration_to_start_end(cls, elem, account):
         kwargs = {}
-        duration = elem.find(f"{{{TNS}}}Duration")
+        duration = elem.find(_T_DURATION)
         if duration is not None:
             for attr in ("start", "end"):
                 f = cls.get_field_by_fieldname(attr)
@@ -1318,11 +1352,8 @@ class AlternateId(EWSElement):
     )
     mailbox = EmailAddressField(field_uri="Mailbox", is_required=True, is_attribute=True)
     is_archive = BooleanField(field_uri="IsArchive", is_required=False, is_attribute=True)
-
-    @classmethod
-    def response_tag(cls):
-        # This element is in TNS in the request and MNS in the response...
-        return f"{{{MNS}}}{cls.ELEMENT_NAME}"
+    # This element is in TNS in the request and MNS in the response...
+    _response_namespace = MNS
 
 
 class AlternatePublicFolderId(EWSElement):
@@ -2112,8 +2143,8 @@ class UserResponse(EWSElement):
     def parse_elem(cls, elem):
         # Possible ErrorCode values:
         #   https://learn.microsoft.com/en-us/exchange/client-developer/web-service-reference/errorcode-soap
-        error_code = get_xml_attr(elem, f"{{{ANS}}}ErrorCode")
-        error_message = get_xml_attr(elem, f"{{{ANS}}}ErrorMessage")
+        error_code = get_xml_attr(elem, _A_ERROR_CODE)
+        error_message = get_xml_attr(elem, _A_ERROR_MESSAGE)
         if error_code == "InternalServerError":
             return ErrorInternalServerError(error_message)
         if error_code == "ServerBusy":
@@ -2130,23 +2161,23 @@ class UserResponse(EWSElement):
         if res.error_code not in ("NoError", "RedirectAddress", "RedirectUrl"):
             return cls(error_code=res.error_code, error_message=res.error_message)
 
-        redirect_target = get_xml_attr(elem, f"{{{ANS}}}RedirectTarget")
+        redirect_target = get_xml_attr(elem, _A_REDIRECT_TARGET)
         redirect_address = redirect_target if res.error_code == "RedirectAddress" else None
         redirect_url = redirect_target if res.error_code == "RedirectUrl" else None
         user_settings_errors = {}
-        settings_errors_elem = elem.find(f"{{{ANS}}}UserSettingErrors")
+        settings_errors_elem = elem.find(_A_USER_SETTING_ERRORS)
         if settings_errors_elem is not None:
             for setting_error in settings_errors_elem:
-                error_code = get_xml_attr(setting_error, f"{{{ANS}}}ErrorCode")
-                error_message = get_xml_attr(setting_error, f"{{{ANS}}}ErrorMessage")
-                name = get_xml_attr(setting_error, f"{{{ANS}}}SettingName")
+                error_code = get_xml_attr(setting_error, _A_ERROR_CODE)
+                error_message = get_xml_attr(setting_error, _A_ERROR_MESSAGE)
+                name = get_xml_attr(setting_error, _A_SETTING_NAME)
                 user_settings_errors[cls.REVERSE_SETTINGS_MAP[name]] = (error_code, error_message)
         user_settings = {}
-        settings_elem = elem.find(f"{{{ANS}}}UserSettings")
+        settings_elem = elem.find(_A_USER_SETTINGS)
         if settings_elem is not None:
             for setting in settings_elem:
-                name = get_xml_attr(setting, f"{{{ANS}}}Name")
-                value = get_xml_attr(setting, f"{{{ANS}}}Value")
+                name = get_xml_attr(setting, _A_NAME)
+                value = get_xml_attr(setting, _A_VALUE)
                 user_settings[cls.REVERSE_SETTINGS_MAP[name]] = value
         return cls(
             redirect_address=redirect_address,
@@ -1,6 +1,7 @@
 import abc
 import logging
 from contextlib import suppress
+from functools import lru_cache
 from itertools import chain
 
 from oauthlib.oauth2 import TokenExpiredError
@@ -366,9 +367,12 @@ class EWSService(SupportedVersionClassMixIn, metaclass=abc.ABCMeta):
         return r
 
     @classmethod
+    @lru_cache
     def supported_api_versions(cls):
-        """Return API versions supported by the service, sorted from newest to oldest"""
-        return sorted({v.api_version for v in Version.all_versions() if cls.supports_version(v)}, reverse=True)
+        """Return API versions supported by the service, sorted from newest to oldest. The result is static, so it is
+        cached per service class.
+        """
+        return tuple(sorted({v.api_version for v in Version.all_versions() if cls.supports_version(v)}, reverse=True))
 
     def _api_versions_to_try(self):
         # Put the hint first in the list, and then all other versions except the hint, from newest to oldest
@@ -953,8 +957,10 @@ def shape_element(tag, shape, additional_fields, version):
 
 def _ids_element(items, item_cls, version, tag):
     item_ids = create_element(tag)
+    # All values are EWSElement instances, so append their elements directly instead of dispatching on type for each
+    # value in set_xml_value().
     for item in items:
-        set_xml_value(item_ids, to_item_id(item, item_cls), version=version)
+        item_ids.append(to_item_id(item, item_cls).to_xml(version=version))
     return item_ids
 
 
@@ -10,7 +10,7 @@ class UploadItems(EWSAccountService):
     element_container_name = f"{{{MNS}}}ItemId"
 
     def call(self, items):
-        # _pool_requests expects 'items', not 'data'
+        # _chunked_get_elements expects 'items', not 'data'
         return self._elems_to_objs(self._chunked_get_elements(self.get_payload, items=items))
 
     def get_payload(self, items):
@@ -1,4 +1,5 @@
 import logging
+import re
 from contextlib import suppress
 
 import requests.auth
@@ -23,6 +24,11 @@ CBA = "CBA"  # Certificate Based Authentication
 # The auth types that must be accompanied by a credentials object
 CREDENTIALS_REQUIRED = (NTLM, BASIC, DIGEST, OAUTH2)
 
+# Auth methods that we detect from the WWW-Authenticate header, as (lowercase token, auth type) pairs. Ordered by
+# preference, most secure method first. See discussion at
+# http://docs.oracle.com/javase/7/docs/technotes/guides/net/http-auth.html
+AUTH_METHOD_PREFERENCES = (("digest", DIGEST), ("ntlm", NTLM), ("basic", BASIC))
+
 AUTH_TYPE_MAP = {
     NTLM: requests_ntlm.HttpNtlmAuth,
     BASIC: requests.auth.HTTPBasicAuth,
@@ -45,6 +51,13 @@ with suppress(ImportError):
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_HEADERS = {"Content-Type": f"text/xml; charset={DEFAULT_ENCODING}", "Accept-Encoding": "gzip, deflate"}
 
+# Extra headers for the autodiscover auth type probe. Must not be mutated by callers.
+AUTODISCOVER_AUTH_HEADERS = {"X-AnchorMailbox": "DUMMY@example.com"}  # Required in case of OAuth
+
+# Matches a token in a WWW-Authenticate header value. Tokens are separated by spaces and commas, except inside quotes. A
+# token ends right after its closing quote, and an unterminated quote extends to the end of the value.
+_AUTH_TOKEN_RE = re.compile(r'[^ ,"]*"[^"]*"?|[^ ,"]+')
+
 
 def get_auth_instance(auth_type, **kwargs):
     """Return an *Auth instance suitable for the requests package.
@@ -80,7 +93,10 @@ def get_service_authtype(protocol):
         data = protocol.dummy_xml()
         log.debug("Requesting %s from %s", data, service_endpoint)
         while True:
-            _back_off_if_needed(retry_policy.back_off_until)
+            back_off_until = retry_policy.back_off_until
+            if back_off_until:
+                # Only call out when a back off is active, which is rarely the case
+                _back_off_if_needed(back_off_until)
             log.debug("Trying to get service auth type for %s", service_endpoint)
             with protocol.raw_session(service_endpoint) as s:
                 try:
@@ -115,8 +131,9 @@ def get_service_authtype(protocol):
 
 def get_autodiscover_authtype(protocol):
     data = protocol.dummy_xml()
-    headers = {"X-AnchorMailbox": "DUMMY@example.com"}  # Required in case of OAuth
-    r = get_unauthenticated_autodiscover_response(protocol=protocol, method="post", headers=headers, data=data)
+    r = get_unauthenticated_autodiscover_response(
+        protocol=protocol, method="post", headers=AUTODISCOVER_AUTH_HEADERS, data=data
+    )
     try:
         auth_type = get_auth_method_from_response(response=r)
         log.debug("Auth type is %s", auth_type)
@@ -130,7 +147,10 @@ def get_unauthenticated_autodiscover_response(protocol, method, headers=None, da
     retry_policy = protocol.retry_policy
     wait = protocol.RETRY_WAIT
     while True:
-        _back_off_if_needed(retry_policy.back_off_until)
+        back_off_until = retry_policy.back_off_until
+        if back_off_until:
+            # Only call out when a back off is active, which is rarely the case
+            _back_off_if_needed(back_off_until)
         log.debug("Trying to get response from %s", service_endpoint)
         with protocol.raw_session(service_endpoint) as s:
             try:
@@ -166,47 +186,25 @@ def get_auth_method_from_response(response):
     log.debug("Response headers: %s", response.headers)
     if response.status_code == 200:
         return NOAUTH
-    # Get auth type from headers
+    # Get auth type from headers, in the order they appear in the response
     for key, val in response.headers.items():
-        if key.lower() == "www-authenticate":
+        key = key.lower()
+        if key == "www-authenticate":
             # Requests will combine multiple HTTP headers into one in 'request.headers'
-            vals = _tokenize(val.lower())
+            vals = set(_tokenize(val.lower()))
             for v in vals:
                 if v.startswith("realm"):
                     realm = v.split("=")[1].strip('"')
                     log.debug("realm: %s", realm)
-            # Prefer most secure auth method if more than one is offered. See discussion at
-            # http://docs.oracle.com/javase/7/docs/technotes/guides/net/http-auth.html
-            if "digest" in vals:
-                return DIGEST
-            if "ntlm" in vals:
-                return NTLM
-            if "basic" in vals:
-                return BASIC
-        elif key.lower() == "ms-diagnostics-public" and "Modern Auth" in val:
+            # Prefer most secure auth method if more than one is offered
+            for token, auth_type in AUTH_METHOD_PREFERENCES:
+                if token in vals:
+                    return auth_type
+        elif key == "ms-diagnostics-public" and "Modern Auth" in val:
             return OAUTH2
     raise UnauthorizedError("No compatible auth type was reported by server")
 
 
 def _tokenize(val):
     # Splits cookie auth values
-    auth_methods = []
-    auth_method = ""
-    quote = False
-    for c in val:
-        if c in (" ", ",") and not quote:
-            if auth_method not in ("", ","):
-                auth_methods.append(auth_method)
-            auth_method = ""
-            continue
-        if c == '"':
-            auth_method += c
-            if quote:
-                auth_methods.append(auth_method)
-                auth_method = ""
-            quote = not quote
-            continue
-        auth_method += c
-    if auth_method:
-        auth_methods.append(auth_method)
-    return auth_methods
+    return _AUTH_TOKEN_RE.findall(val)
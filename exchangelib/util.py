@@ -1,3 +1,4 @@
+import binascii
 import datetime
 import io
 import itertools
@@ -6,11 +7,10 @@ import re
 import socket
 import time
 import xml.sax.handler  # nosec
-from base64 import b64decode, b64encode
 from codecs import BOM_UTF8
 from contextlib import suppress
 from decimal import Decimal
-from functools import wraps
+from functools import lru_cache, wraps
 from threading import get_ident
 from urllib.parse import urlparse
 
@@ -30,6 +30,14 @@ from .errors import ErrorInternalServerTransientError, ErrorTimeoutExpired, Rela
 log = logging.getLogger(__name__)
 xml_log = logging.getLogger(f"{__name__}.xml")
 
+pybase64 = None
+with suppress(ImportError):
+    # SIMD-accelerated base64 is optional
+    import pybase64
+
+# Only use pybase64 for data above this size. For small values, the call overhead outweighs the faster codec.
+PYBASE64_MIN_SIZE = 8 * 1024
+
 
 def require_account(f):
     @wraps(f)
@@ -193,7 +201,7 @@ def value_to_xml_text(value):
     if isinstance(value, bool):
         return "1" if value else "0"
     if isinstance(value, bytes):
-        return b64encode(value).decode("ascii")
+        return b64encode(value)
     if isinstance(value, (int, Decimal)):
         return str(value)
     if isinstance(value, datetime.time):
@@ -270,11 +278,17 @@ def sanitize_xml(data, replacement=b"?"):
     return _ILLEGAL_XML_ESCAPE_CHARS_RE.sub(replacement, data)
 
 
-def create_element(name, attrs=None, nsmap=None):
+@lru_cache(maxsize=1024)
+def _expand_tag(name):
+    # Translate a prefixed tag name like 't:ItemId' to Clark notation. The set of tag names we use is small and fixed.
     if ":" in name:
         ns, name = name.split(":")
-        name = f"{{{ns_translation[ns]}}}{name}"
-    elem = _forgiving_parser.makeelement(name, nsmap=nsmap)
+        return f"{{{ns_translation[ns]}}}{name}"
+    return name
+
+
+def create_element(name, attrs=None, nsmap=None):
+    elem = _forgiving_parser.makeelement(_expand_tag(name), nsmap=nsmap)
     if attrs:
         # Try hard to keep attribute order, to ensure deterministic output. This simplifies testing.
         # Dicts in Python 3.6+ have stable ordering.
@@ -330,6 +344,24 @@ def prepare_input_source(source):
     return source
 
 
+def b64encode(data):
+    # Like base64.b64encode() but returns a str. Calls the C implementation directly to skip the wrapper overhead.
+    if pybase64 is not None and len(data) >= PYBASE64_MIN_SIZE:
+        return pybase64.b64encode(data).decode("ascii")
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def b64decode(data):
+    # Like base64.b64decode() with default arguments. Accepts both bytes and ASCII-only str.
+    if pybase64 is not None and len(data) >= PYBASE64_MIN_SIZE:
+        # In non-strict mode, pybase64 handles e.g. padding in the middle of the data differently than binascii. Only
+        # use it for strictly valid input, and leave everything else to binascii. This way, the result never depends
+        # on the size of the data or on whether pybase64 is installed.
+        with suppress(binascii.Error):
+            return pybase64.b64decode(data, validate=True)
+    return binascii.a2b_base64(data)
+
+
 def safe_b64decode(data):
     # Incoming base64-encoded data is not always padded to a multiple of 4. Python's parser is stricter and requires
     # padding. Add padding if it's needed.
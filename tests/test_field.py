@@ -19,6 +19,7 @@ from exchangelib.fields import (
     EnumListField,
     ExtendedPropertyField,
     ExtendedPropertyListField,
+    IdField,
     IntegerField,
     InvalidChoiceForVersion,
     InvalidFieldForVersion,
@@ -65,6 +66,18 @@ class FieldTest(TimedTestCase):
             "XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX' exceeds length 255",
         )
 
+        field = IdField("foo", field_uri="bar", is_required=True)
+        self.assertEqual(field.clean("X" * 512), "X" * 512)  # IDs may be longer than other CharField values
+        with self.assertRaises(ValueError) as e:
+            field.clean(None)
+        self.assertEqual(str(e.exception), "'foo' is a required field with no default")
+        with self.assertRaises(TypeError) as e:
+            field.clean(1)
+        self.assertEqual(str(e.exception), "Field 'foo' value 1 must be of type <class 'str'>")
+        with self.assertRaises(ValueError) as e:
+            field.clean("X" * 513)
+        self.assertTrue(str(e.exception).endswith("exceeds length 512"))
+
         field = DateTimeField("foo", field_uri="bar")
         with self.assertRaises(ValueError) as e:
             field.clean(datetime.datetime(2017, 1, 1))  # Datetime values must be timezone aware
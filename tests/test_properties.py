@@ -6,8 +6,21 @@ from exchangelib.fields import GenericEventListField, InvalidField, InvalidField
 from exchangelib.folders import Folder, RootOfHierarchy
 from exchangelib.indexed_properties import PhysicalAddress
 from exchangelib.items import BulkCreateResult, Item
-from exchangelib.properties import UID, Body, DLMailbox, EWSElement, Fields, HTMLBody, ItemId, Mailbox, MessageHeader
-from exchangelib.util import TNS, to_xml
+from exchangelib.properties import (
+    UID,
+    AlternateId,
+    Body,
+    DLMailbox,
+    EWSElement,
+    Fields,
+    HTMLBody,
+    ItemId,
+    Mailbox,
+    MessageHeader,
+    PersonaId,
+    RoomList,
+)
+from exchangelib.util import MNS, TNS, to_xml
 from exchangelib.version import EXCHANGE_2010, EXCHANGE_2013, Version
 
 from .common import TimedTestCase
@@ -178,6 +191,32 @@ class PropertiesTest(TimedTestCase):
         self.assertNotEqual(ItemId("X", "Y"), ItemId("Z", "Z"))
         self.assertNotEqual(ItemId("X", "Y"), None)
 
+    def test_tags(self):
+        self.assertEqual(ItemId.request_tag(), "t:ItemId")
+        self.assertEqual(ItemId.response_tag(), f"{{{TNS}}}ItemId")
+        # Elements that use a different tag in responses than in requests. Subclasses must inherit this behavior.
+
+        class MyRoomList(RoomList):
+            pass
+
+        class MyPersonaId(PersonaId):
+            ELEMENT_NAME = "MyPersonaId"
+
+        class MyAlternateId(AlternateId):
+            pass
+
+        for cls, request_tag, response_tag in (
+            (RoomList, "m:RoomList", f"{{{TNS}}}Address"),
+            (MyRoomList, "m:RoomList", f"{{{TNS}}}Address"),
+            (PersonaId, "m:PersonaId", f"{{{TNS}}}PersonaId"),
+            (MyPersonaId, "m:MyPersonaId", f"{{{TNS}}}MyPersonaId"),
+            (AlternateId, "t:AlternateId", f"{{{MNS}}}AlternateId"),
+            (MyAlternateId, "t:AlternateId", f"{{{MNS}}}AlternateId"),
+        ):
+            with self.subTest(cls=cls):
+                self.assertEqual(cls.request_tag(), request_tag)
+                self.assertEqual(cls.response_tag(), response_tag)
+
     def test_mailbox(self):
         mbx = Mailbox(name="XXX")
         with self.assertRaises(ValueError):
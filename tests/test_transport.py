@@ -2,7 +2,7 @@ import requests
 import requests_mock
 
 from exchangelib.errors import UnauthorizedError
-from exchangelib.transport import BASIC, DIGEST, NOAUTH, NTLM, get_auth_method_from_response
+from exchangelib.transport import BASIC, DIGEST, NOAUTH, NTLM, OAUTH2, _tokenize, get_auth_method_from_response
 
 from .common import TimedTestCase
 
@@ -81,3 +81,41 @@ class TransportTest(TimedTestCase):
         m.get(url, status_code=401, headers={"WWW-Authenticate": 'Basic realm="X1", Digest realm="X2", NTLM'})
         r = requests.get(url)
         self.assertEqual(get_auth_method_from_response(r), DIGEST)
+
+        url = "http://example.com/modern_auth"
+        diagnostics = '4.2.1.2;reason="Basic auth is disabled. Use Modern Auth"'
+        m.get(url, status_code=401, headers={"ms-diagnostics-public": diagnostics})
+        r = requests.get(url)
+        self.assertEqual(get_auth_method_from_response(r), OAUTH2)
+
+        # When both headers are present, the first one in the response wins
+        url = "http://example.com/modern_auth_first"
+        m.get(
+            url,
+            status_code=401,
+            headers={"ms-diagnostics-public": diagnostics, "WWW-Authenticate": 'Basic realm="X1"'},
+        )
+        r = requests.get(url)
+        self.assertEqual(get_auth_method_from_response(r), OAUTH2)
+
+        url = "http://example.com/modern_auth_last"
+        m.get(
+            url,
+            status_code=401,
+            headers={"WWW-Authenticate": 'Basic realm="X1"', "ms-diagnostics-public": diagnostics},
+        )
+        r = requests.get(url)
+        self.assertEqual(get_auth_method_from_response(r), BASIC)
+
+    def test_tokenize(self):
+        self.assertEqual(_tokenize(""), [])
+        self.assertEqual(_tokenize("ntlm"), ["ntlm"])
+        self.assertEqual(_tokenize(" basic,, ntlm "), ["basic", "ntlm"])
+        self.assertEqual(
+            _tokenize('digest realm="foo@bar.com", qop="auth,auth-int", nonce="mumble"'),
+            ["digest", 'realm="foo@bar.com"', 'qop="auth,auth-int"', 'nonce="mumble"'],
+        )
+        # A token ends at the closing quote
+        self.assertEqual(_tokenize('a"b c"d'), ['a"b c"', "d"])
+        # An unterminated quote runs to the end of the value
+        self.assertEqual(_tokenize('basic realm="foo, bar'), ["basic", 'realm="foo, bar'])
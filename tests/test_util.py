@@ -1,3 +1,4 @@
+import binascii
 import io
 import logging
 from contextlib import suppress
@@ -7,6 +8,7 @@ from unittest.mock import patch
 import requests
 import requests_mock
 
+import exchangelib.util
 from exchangelib.errors import (
     CASError,
     ErrorServerBusy,
@@ -25,6 +27,8 @@ from exchangelib.util import (
     ParseError,
     PrettyXmlHandler,
     StreamingBase64Parser,
+    b64decode,
+    b64encode,
     chunkify,
     get_domain,
     get_redirect_url,
@@ -36,7 +40,7 @@ from exchangelib.util import (
     xml_to_str,
 )
 
-from .common import EWSTest, mock_post, mock_session_exception
+from .common import EWSTest, TimedTestCase, mock_post, mock_session_exception
 
 
 class UtilTest(EWSTest):
@@ -176,16 +180,12 @@ class UtilTest(EWSTest):
     def test_anonymizing_handler(self):
         h = AnonymizingXmlHandler(forbidden_strings=("XXX", "yyy"))
         self.assertEqual(
-            xml_to_str(
-                h.parse_bytes(
-                    b"""\
+            xml_to_str(h.parse_bytes(b"""\
 <Root>
   <t:ItemId Id="AQApA=" ChangeKey="AQAAAB"/>
   <Foo>XXX</Foo>
   <Foo><Bar>Hello yyy world</Bar></Foo>
-</Root>"""
-                )
-            ),
+</Root>""")),
             """\
 <Root>
   <t:ItemId Id="DEADBEEF=" ChangeKey="DEADBEEF="/>
@@ -370,5 +370,23 @@ class UtilTest(EWSTest):
         )
 
 
+class Base64Test(TimedTestCase):
+    def test_b64encode_b64decode(self):
+        self.assertEqual(b64encode(b"Hello world"), "SGVsbG8gd29ybGQ=")
+        self.assertEqual(b64decode("SGVsbG8gd29ybGQ="), b"Hello world")
+        self.assertEqual(b64decode(b"SGVsbG8gd29ybGQ="), b"Hello world")
+        # Test data large enough to use pybase64, with and without pybase64 installed
+        data = bytes(range(256)) * 100
+        for module in (exchangelib.util.pybase64, None):
+            with patch("exchangelib.util.pybase64", module):
+                encoded = b64encode(data)
+                self.assertIsInstance(encoded, str)
+                self.assertEqual(b64decode(encoded), data)
+                self.assertEqual(b64decode(encoded.encode("ascii")), data)
+                # Non-canonical input must decode the same way regardless of size and pybase64 availability
+                for garbled in (encoded[:100] + "=" + encoded[100:], encoded[:100] + "\r\n" + encoded[100:]):
+                    self.assertEqual(b64decode(garbled), binascii.a2b_base64(garbled))
+
+
 def _bytes_to_iter(content):
     return iter((bytes([b]) for b in content))